@@ -0,0 +1,37 @@
+r"""*pytest configuration for the* ``pent`` *test suite*.
+
+``pent`` Extracts Numerical Text.
+
+**Author**
+    Brian Skinn (bskinn@alum.mit.edu)
+
+**Copyright**
+    \(c) Brian Skinn 2018-2019
+
+**Source Repository**
+    http://www.github.com/bskinn/pent
+
+**Documentation**
+    http://pent.readthedocs.io
+
+**License**
+    The MIT License; see |license_txt|_ for full license terms
+
+**Members**
+
+*(none documented)*
+
+"""
+
+import pathlib
+
+import numpy as np
+import pytest
+
+import pent
+
+
+@pytest.fixture(autouse=True)
+def add_doctest_globals(doctest_namespace):
+    """Provide the README doctest globals, as in ``pent_readme``."""
+    doctest_namespace.update({"pent": pent, "np": np, "pathlib": pathlib})
@@ -27,8 +27,11 @@ r"""*Core test objects for* ``pent`` *test suite*.
 """
 
 
+import contextlib
+import functools as ft
 import gzip
 import itertools as itt
+import os
 from pathlib import Path
 import re
 from textwrap import dedent
@@ -39,29 +42,63 @@ from pent import ParserField
 from pent.errors import LineError
 from pent.thrulist import ThruList
 
+from .testdata import (
+    mblock_repeated_result,
+    mblock_result,
+    number_patterns,
+    number_sign_vals,
+    opt_1line_tail_data,
+    opt_1line_tail_expect_block,
+    opt_1line_tail_expect_struct,
+)
+
 
 # HELPERS
 testdir_path = Path() / "pent" / "test"
 
+# Static cross-products of the pattern enums, iterated by many tests.
+_NS_PAIRS = tuple(itt.product(pent.Number, pent.Sign))
 
-class SuperPent:
-    """Superclass of various test classes, with common methods."""
+# The OptionalLine token has no capture form, so it's left out.
+_CONTENT_CAPTURE = tuple(
+    (c, cap)
+    for c, cap in itt.product(pent.Content, (True, False))
+    if c is not pent.Content.OptionalLine
+)
 
-    import pent
+# Shared Parser, with memoized line conversion, for all pattern tests
+_PARSER = pent.Parser(body="")
+_convert_line = ft.lru_cache(maxsize=4096)(_PARSER.convert_line)
 
-    prs = pent.Parser(body="")
+# Set PENT_FAST_TESTS to skip per-iteration subTests in the hot loops;
+# the first failing assertion then halts the whole test method
+_FAST = bool(os.environ.get("PENT_FAST_TESTS"))
 
-    @staticmethod
-    def does_parse_match(re_pat, s):
-        """Run match-or-not test on `s` using regex pattern `re_pat`."""
-        m = re.search(re_pat, s)
 
-        return m is not None
+@contextlib.contextmanager
+def _maybe_subtest(tc, make_name, *args):
+    """Run the block in a subTest of `tc`, unless in fast-test mode.
+
+    The subTest name is only composed, as ``make_name(*args)``,
+    when a subTest is actually used.
+
+    """
+    if _FAST:
+        yield
+    else:
+        with tc.subTest(make_name(*args)):
+            yield
+
+
+class SuperPent:
+    """Superclass of various test classes, with common methods."""
+
+    prs = _PARSER
 
     @staticmethod
     def make_testname(v, n, s):
         """Compose test name from a numerical value and pattern Number/Sign."""
-        return "{0}_{1}_{2}".format(v, n, s)
+        return "_".join((v, n, s))
 
     @staticmethod
     def get_file(fname):
@@ -81,14 +118,10 @@ class TestPentTokens(ut.TestCase, SuperPent):
 
     def test_arbitrary_bad_token(self):
         """Confirm bad tokens raise errors."""
-        import pent
-
         self.assertRaises(pent.TokenError, pent.Token, "abcd")
 
     def test_group_enclosures(self):
         """Ensure 'ignore' flag is properly set."""
-        import pent
-
         testname_fmt = "{0}_{1}"
         token_fmt = {
             pent.Content.Any: "~{0}",
@@ -97,52 +130,32 @@ class TestPentTokens(ut.TestCase, SuperPent):
             pent.Content.Misc: "&{0}.",
         }
 
-        for ct, cap in itt.product(pent.Content, (True, False)):
-            if ct is pent.Content.OptionalLine:
-                continue
-
+        for ct, cap in _CONTENT_CAPTURE:
             t = pent.Token(token_fmt[ct].format("!" if cap else ""))
             with self.subTest(testname_fmt.format(ct, cap)):
                 self.assertEqual(t.capture, cap)
 
-    def test_number_property(self):
-        """Ensure t.number properties return correct values."""
-        import pent
-
-        from .testdata import number_patterns as npats
-
-        for p in npats.values():
-            pat = p.format("", "", pent.Quantity.Single)
-            with self.subTest(pat):
-                self.assertEqual(pent.Token(pat).number, pent.Number(p[-1]))
-
-        with self.subTest("string"):
-            self.assertEqual(pent.Token("@.abcd").number, None)
-
-        with self.subTest("any"):
-            self.assertEqual(pent.Token("~").number, None)
-
-    def test_sign_property(self):
-        """Ensure t.sign properties return correct values."""
-        import pent
-
-        from .testdata import number_patterns as npats
-
-        for p in npats.values():
+    def test_token_number_and_sign_properties(self):
+        """Ensure t.number and t.sign properties return correct values."""
+        for p in number_patterns.values():
             pat = p.format("", "", pent.Quantity.Single)
             with self.subTest(pat):
-                self.assertEqual(pent.Token(pat).sign, pent.Sign(p[-2]))
+                tok = pent.Token(pat)
+                self.assertEqual(tok.number, pent.Number(p[-1]))
+                self.assertEqual(tok.sign, pent.Sign(p[-2]))
 
         with self.subTest("string"):
-            self.assertEqual(pent.Token("@.abcd").sign, None)
+            tok = pent.Token("@.abcd")
+            self.assertEqual(tok.number, None)
+            self.assertEqual(tok.sign, None)
 
         with self.subTest("any"):
-            self.assertEqual(pent.Token("~").sign, None)
+            tok = pent.Token("~")
+            self.assertEqual(tok.number, None)
+            self.assertEqual(tok.sign, None)
 
     def test_qty_property_on_any_and_optline(self):
         """Ensure t.match_quantity property returns correct value on 'any'."""
-        import pent
-
         self.assertEqual(pent.Token("~").match_quantity, None)
         self.assertEqual(pent.Token("?").match_quantity, None)
 
@@ -197,45 +210,87 @@ class TestPentThruList(ut.TestCase, SuperPent):
 class TestPentCorePatterns(ut.TestCase, SuperPent):
     """Confirming basic pattern matching of the core regex patterns."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Pre-compile the wordified number/sign patterns."""
+        cls._compiled_np = {
+            (n, s): re.compile(pent.std_wordify(pent.number_patterns[(n, s)]))
+            for n, s in _NS_PAIRS
+        }
+
     def test_number_and_sign_matching(self):
         """Confirm number and sign patterns match the right string patterns."""
-        import pent
+        for v in number_sign_vals:
+            for (n, s) in _NS_PAIRS:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    npat = self._compiled_np[(n, s)]
 
-        from .testdata import number_sign_vals as vals
+                    res = bool(npat.search(v))
 
-        for (v, n, s) in itt.product(vals, pent.Number, pent.Sign):
-            with self.subTest(self.make_testname(v, n, s)):
-                npat = pent.number_patterns[(n, s)]
-                npat = pent.std_wordify(npat)
-
-                res = self.does_parse_match(npat, v)
-
-                self.assertEqual(vals[v][(n, s)], res, msg=npat)
+                    expected = number_sign_vals[v][(n, s)]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        res, msg=npat.pattern
+                    )
 
     def test_raw_single_value_space_delimited(self):
         """Confirm single-value parsing from a line works with raw patterns."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This line contains the value {} with space delimit."
 
-        for v in vals:
-            test_str = test_line.format(v)
+        test_strs = tuple((v, test_line.format(v)) for v in number_sign_vals)
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = pent.number_patterns[(n, s)]
-                    npat = pent.std_wordify(npat)
+        for (n, s) in _NS_PAIRS:
+            npat = self._compiled_np[(n, s)]
 
-                    res = self.does_parse_match(npat, test_str)
+            for (v, test_str) in test_strs:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    res = bool(npat.search(test_str))
 
-                    self.assertEqual(vals[v][(n, s)], res, msg=test_str)
+                    expected = number_sign_vals[v][(n, s)]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        res, msg=test_str
+                    )
 
 
 class TestPentParserPatterns(ut.TestCase, SuperPent):
     """Confirming pattern matching of patterns generated by the Parser."""
 
+    # Token-line templates, filled with the Sign and Number of each case.
+    # All begin with '~', so the regexes can be anchored with .match().
+    _NS_TEMPLATES = {
+        "space_delim": "~ @!.contains ~! #!.{0}{1} ~",
+        "single_num": "~ #!.{0}{1} ~",
+        "colon_num": "~ @x.: #!.{0}{1} ~",
+        "string_num": "~ @!.string ~ #!.{0}{1} ~",
+    }
+
+    # String-capture patterns, keyed by subTest name. These can't be
+    # merged into one alternation, since each reuses the same group name.
+    _STRING_CAPTURE_PATS = {
+        "capture": "~ @!.word ~",
+        "ignore": "~ @.word ~",
+        "symbol": "~ @!.[symbol] ~",
+        "with_space": "~ '@!.string with' ~",
+    }
+
+    # Compiled Number/Sign line regexes, keyed by (template, Number, Sign)
+    _compiled = {}
+
+    def ns_line_pattern(self, template, n, s):
+        """Return compiled Parser regex for `template` filled w/Number/Sign.
+
+        Compiled on first use and cached on the class, so that a failure
+        to generate any one pattern is reported by the subTest using it.
+
+        """
+        key = (template, n, s)
+
+        try:
+            return self._compiled[key]
+        except KeyError:
+            pat = _convert_line(template.format(s.value, n.value))[0]
+            self._compiled[key] = re.compile(pat)
+            return self._compiled[key]
+
     def test_empty_pattern_matches_blank_line(self):
         """Confirm an empty pattern matches only a blank line."""
         self.assertIsNotNone(re.search(self.prs.pattern(), ""))
@@ -243,14 +298,10 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_token_error_raised_at_init(self):
         """Ensure TokenError raised at instantiation w/bad token."""
-        import pent
-
         self.assertRaises(pent.TokenError, pent.Parser, body="abcd")
 
     def test_group_tags_or_not(self):
         """Confirm group tags are added when needed; omitted when not."""
-        import pent
-
         patterns = {
             pent.Content.Any: "~{}",
             pent.Content.String: "@{}.this",
@@ -258,14 +309,11 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
             pent.Content.Misc: "&{}.",
         }
 
-        for content, capture in itt.product(pent.Content, (True, False)):
-            if content is pent.Content.OptionalLine:
-                continue
-
+        for content, capture in _CONTENT_CAPTURE:
             test_name = "{0}_{1}".format(content, capture)
             with self.subTest(test_name):
                 test_pat = patterns[content].format("!" if capture else "")
-                test_rx = self.prs.convert_line(test_pat)[0]
+                test_rx = _convert_line(test_pat)[0]
                 self.assertEqual(capture, "(?P<" in test_rx, msg=test_pat)
 
     def test_parser_single_line_space_delim(self):
@@ -274,61 +322,48 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         Also tests the 'suppress' number mode.
 
         """
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This line contains the value {} with space delimit."
-        test_pat_template = "~ @!.contains ~! #!.{0}{1} ~"
-
-        for v in vals:
-            test_str = test_line.format(v)
+        test_pat_template = self._NS_TEMPLATES["space_delim"]
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        test_strs = tuple((v, test_line.format(v)) for v in number_sign_vals)
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for (n, s) in _NS_PAIRS:
+            for (v, test_str) in test_strs:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    npat = self.ns_line_pattern(test_pat_template, n, s)
+                    res = bool(npat.match(test_str))
 
-                    res = self.does_parse_match(npat, test_str)
-
-                    self.assertEqual(vals[v][n, s], res, msg=test_str)
+                    expected = number_sign_vals[v][n, s]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        res, msg=test_str
+                    )
 
     def test_string_capture(self):
         """Confirm string capture works when desired; is ignored when not."""
-        import pent
-
         test_line = "This is a string with a word and [symbol] in it."
-        test_pat_capture = "~ @!.word ~"
-        test_pat_ignore = "~ @.word ~"
-        test_pat_symbol = "~ @!.[symbol] ~"
-        test_pat_with_space = "~ '@!.string with' ~"
+        pats = self._STRING_CAPTURE_PATS
 
         with self.subTest("capture"):
-            pat = self.prs.convert_line(test_pat_capture)[0]
-            m = re.search(pat, test_line)
+            m = re.search(_convert_line(pats["capture"])[0], test_line)
             self.assertIsNotNone(m)
             self.assertEqual(m.group(pent.Token.group_prefix + "0"), "word")
 
         with self.subTest("ignore"):
-            pat = self.prs.convert_line(test_pat_ignore)[0]
-            m = re.search(pat, test_line)
+            m = re.search(_convert_line(pats["ignore"])[0], test_line)
             self.assertIsNotNone(m)
             self.assertRaises(
                 IndexError, m.group, pent.Token.group_prefix + "0"
             )
 
         with self.subTest("symbol"):
-            pat = self.prs.convert_line(test_pat_symbol)[0]
-            m = re.search(pat, test_line)
+            m = re.search(_convert_line(pats["symbol"])[0], test_line)
             self.assertIsNotNone(m)
             self.assertEqual(
                 m.group(pent.Token.group_prefix + "0"), "[symbol]"
             )
 
         with self.subTest("with_space"):
-            pat = self.prs.convert_line(test_pat_with_space)[0]
-            m = re.search(pat, test_line)
+            m = re.search(_convert_line(pats["with_space"])[0], test_line)
             self.assertIsNotNone(m)
             self.assertEqual(
                 m.group(pent.Token.group_prefix + "0"), "string with"
@@ -336,8 +371,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_misc_token_matches_various(self):
         """Confirm scope of misc token matching."""
-        import pent
-
         vals = ["Cu", "43/yfd", "foo", "355.57"]
         bads = ["foo bar", "baz 456", "quux\t2e5"]
 
@@ -345,11 +378,12 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
         test_str = "This line has {} in it."
 
+        pat = _convert_line(test_pat)[0]
+
         for v in vals:
             test_line = test_str.format(v)
 
             with self.subTest("ok_" + v):
-                pat = self.prs.convert_line(test_pat)[0]
                 m = re.search(pat, test_line)
                 self.assertIsNotNone(m)
                 self.assertEqual(m.group(pent.Token.group_prefix + "0"), v)
@@ -358,36 +392,29 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
             test_line = test_str.format(v)
 
             with self.subTest("bad_" + v):
-                pat = self.prs.convert_line(test_pat)[0]
                 m = re.search(pat, test_line)
                 self.assertIsNotNone(m)
                 self.assertNotEqual(m.group(pent.Token.group_prefix + "0"), v)
 
     def test_single_num_capture(self):
         """Confirm single-number capture works."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with {} in it."
-        test_pat_template = "~ #!.{0}{1} ~"
-
-        for v in vals:
-            test_str = test_line.format(v)
-
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        test_pat_template = self._NS_TEMPLATES["single_num"]
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        test_strs = tuple((v, test_line.format(v)) for v in number_sign_vals)
 
-                    m = re.search(npat, test_str)
+        for (n, s) in _NS_PAIRS:
+            for (v, test_str) in test_strs:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    npat = self.ns_line_pattern(test_pat_template, n, s)
+                    m = npat.match(test_str)
 
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
+                    expected = number_sign_vals[v][n, s]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        m, msg=test_str
                     )
 
-                    if m is not None:
+                    if m:
                         self.assertEqual(
                             m.group(pent.Token.group_prefix + "0"), v
                         )
@@ -399,12 +426,10 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         no-space-before check.
 
         """
-        import pent
-
         test_str = "This is a string with 123-456 in it."
         test_pat = "~ #x!.+i #!.-i ~"
 
-        npat = self.prs.convert_line(test_pat)[0]
+        npat = _convert_line(test_pat)[0]
 
         m = re.search(npat, test_str)
 
@@ -414,58 +439,46 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_single_num_preceding_colon_capture(self):
         """Confirm single-number capture works, with preceding colon."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with :{} in it, after a colon."
-        test_pat_template = "~ @x.: #!.{0}{1} ~"
-
-        for v in vals:
-            test_str = test_line.format(v)
+        test_pat_template = self._NS_TEMPLATES["colon_num"]
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        test_strs = tuple((v, test_line.format(v)) for v in number_sign_vals)
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for (n, s) in _NS_PAIRS:
+            for (v, test_str) in test_strs:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    npat = self.ns_line_pattern(test_pat_template, n, s)
+                    m = npat.match(test_str)
 
-                    m = re.search(npat, test_str)
-
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
+                    expected = number_sign_vals[v][n, s]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        m, msg=test_str
                     )
 
-                    if m is not None:
+                    if m:
                         self.assertEqual(
                             m.group(pent.Token.group_prefix + "0"), v
                         )
 
     def test_string_and_single_num_capture(self):
         """Confirm multiple capture of string and single number."""
-        import pent
-
-        from .testdata import number_sign_vals as vals
-
         test_line = "This is a string with {} in it."
-        test_pat_template = "~ @!.string ~ #!.{0}{1} ~"
-
-        for v in vals:
-            test_str = test_line.format(v)
+        test_pat_template = self._NS_TEMPLATES["string_num"]
 
-            for (n, s) in itt.product(pent.Number, pent.Sign):
-                test_pat = test_pat_template.format(s.value, n.value)
+        test_strs = tuple((v, test_line.format(v)) for v in number_sign_vals)
 
-                with self.subTest(self.make_testname(v, n, s)):
-                    npat = self.prs.convert_line(test_pat)[0]
+        for (n, s) in _NS_PAIRS:
+            for (v, test_str) in test_strs:
+                with _maybe_subtest(self, self.make_testname, v, n, s):
+                    npat = self.ns_line_pattern(test_pat_template, n, s)
+                    m = npat.match(test_str)
 
-                    m = re.search(npat, test_str)
-
-                    self.assertEqual(
-                        vals[v][n, s], m is not None, msg=test_str
+                    expected = number_sign_vals[v][n, s]
+                    (self.assertTrue if expected else self.assertFalse)(
+                        m, msg=test_str
                     )
 
-                    if m is not None:
+                    if m:
                         self.assertEqual(
                             m.group(pent.Token.group_prefix + "0"), "string"
                         )
@@ -475,21 +488,17 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_number_ending_sentence(self):
         """Check that a number at the end of a sentence matches correctly."""
-        import pent
-
-        from .testdata import number_patterns as npats
-
         test_line = "This sentence ends with a number {}."
         test_pat = "~ {} @.."
 
-        for n in npats:
-            token = npats[n].format(
+        for n in number_patterns:
+            token = number_patterns[n].format(
                 pent.SpaceAfter.Prohibited,
                 pent.Token._s_capture,
                 pent.Quantity.Single,
             )
             with self.subTest(token):
-                pat = self.prs.convert_line(test_pat.format(token))[0]
+                pat = _convert_line(test_pat.format(token))[0]
                 m = re.search(pat, test_line.format(n))
 
                 self.assertIsNotNone(m, msg=test_line.format(n) + token)
@@ -497,37 +506,33 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_match_entire_line(self):
         """Confirm the tilde works to match an entire line."""
-        import pent
-
         test_line = "This is a line with whatever weird (*#$(*&23646{}}{#$"
 
         with self.subTest("capture"):
-            pat = self.prs.convert_line("~!")[0]
-            self.assertTrue(self.does_parse_match(pat, test_line))
+            pat = re.compile(_convert_line("~!")[0])
+            m = pat.fullmatch(test_line)
+            self.assertIsNotNone(m)
 
-            m = re.search(pat, test_line)
             self.assertEqual(test_line, m.group(pent.Token.group_prefix + "0"))
 
         with self.subTest("no_capture"):
-            pat = self.prs.convert_line("~")[0]
-            self.assertTrue(self.does_parse_match(pat, test_line))
+            pat = re.compile(_convert_line("~")[0])
+            m = pat.fullmatch(test_line)
+            self.assertIsNotNone(m)
 
-            m = re.search(pat, test_line)
             self.assertRaises(
                 IndexError, m.group, pent.Token.group_prefix + "0"
             )
 
     def test_any_token_capture_ranges(self):
         """Confirm 'any' captures work as expected with other tokens."""
-        import pent
-
         test_line_start = "This is a line "
         test_line_end = " with a number in brackets in the middle."
         test_num = "2e-4"
         test_line = test_line_start + "[" + test_num + "]" + test_line_end
 
-        pat = self.prs.convert_line("~! @x.[ #x!..g @x.] ~!")[0]
-        m = re.search(pat, test_line)
+        pat = _convert_line("~! @x.[ #x!..g @x.] ~!")[0]
+        m = re.match(pat, test_line)
 
         self.assertEqual(
             m.group(pent.Token.group_prefix + "0"), test_line_start
@@ -537,15 +542,13 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_one_or_more_str_nospace(self):
         """Confirm one-or-more str token works as expected w/no space."""
-        import pent
-
         test_string = "This is a test {} string."
         test_pat = "~ @{}+foo ~"
 
         for qty, cap in itt.product((1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
+                pat = _convert_line(pat)[0]
 
                 work_str = test_string.format("foo" * qty)
 
@@ -563,15 +566,13 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_one_or_more_str_with_space(self):
         """Confirm one-or-more str token works as expected w/space."""
-        import pent
-
         test_string = "This is a test {}string."
         test_pat = "~ '@x{}+foo ' ~"
 
         for qty, cap in itt.product((1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
+                pat = _convert_line(pat)[0]
 
                 work_str = test_string.format("foo " * qty)
 
@@ -590,15 +591,13 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_optional_str(self):
         """Confirm single optional str token works as expected."""
-        import pent
-
         test_string = "This is a test {} string."
         test_pat = "~ @.test @{}?foo @x.string ~"
 
         for there, cap in itt.product(*itt.repeat((True, False), 2)):
             with self.subTest("There: {0}, Cap: {1}".format(there, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                prs_pat = self.prs.convert_line(pat)[0]
+                prs_pat = _convert_line(pat)[0]
 
                 work_str = test_string.format("foo" if there else "")
 
@@ -624,15 +623,13 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_zero_or_more_str(self):
         """Confirm zero-or-more str token works as expected."""
-        import pent
-
         test_string = "This is a test {}string."
         test_pat = "~ @{}*foo ~"
 
         for qty, cap in itt.product((0, 1, 2, 3), (True, False)):
             with self.subTest("Qty: {0}, Cap: {1}".format(qty, cap)):
                 pat = test_pat.format(pent.Token._s_capture if cap else "")
-                pat = self.prs.convert_line(pat)[0]
+                pat = _convert_line(pat)[0]
 
                 work_str = test_string.format("foo " * qty)
 
@@ -651,12 +648,10 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
     @ut.skip("Not implementing optional/zero-or-more tokens")
     def test_one_or_more_doesnt_match_zero_reps(self):
         """Confirm one-or-more str doesn't match if string isn't there."""
-        import pent
-
         test_string = "This is  a test string."
         test_pat = "~ @.is @!?absolutely @.a ~"
 
-        m = re.search(self.prs.convert_line(test_pat)[0], test_string)
+        m = re.search(_convert_line(test_pat)[0], test_string)
 
         self.assertEqual("", m.group(pent.Token.group_prefix + "0"))
 
@@ -664,34 +659,32 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         """Confirm optional-line flag is only accepted as first token."""
         with self.subTest("expect_good"):
             try:
-                self.prs.convert_line("? #!..g")
+                _convert_line("? #!..g")
             except LineError:
                 self.fail("Optional-line token parsing failed unexpectedly.")
 
         with self.subTest("expect_fail"):
             with self.assertRaises(LineError):
-                self.prs.convert_line("#!..g ?")
+                _convert_line("#!..g ?")
 
     def test_optional_single_line_tail(self):
         """Confirm optional-line parsing works."""
-        import pent
-
-        from .testdata import opt_1line_tail_data as data
-        from .testdata import opt_1line_tail_expect_block as expect_block
-        from .testdata import opt_1line_tail_expect_struct as expect_struct
-
         prs = pent.Parser(
             head="@.HEAD",
             body=pent.Parser(head="#++i", body="#!+.f", tail="? @!.FOOT"),
         )
 
-        for i, tup in enumerate(zip(data, expect_block)):
+        for i, tup in enumerate(
+            zip(opt_1line_tail_data, opt_1line_tail_expect_block)
+        ):
             d, e = tup
             with self.subTest("block_{}".format(i)):
                 result = prs.capture_body(d)
                 self.assertEqual(result, e)
 
-        for i, tup in enumerate(zip(data, expect_struct)):
+        for i, tup in enumerate(
+            zip(opt_1line_tail_data, opt_1line_tail_expect_struct)
+        ):
             d, e = tup
             res_struct = []
 
@@ -703,8 +696,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_body_cleared_after_init(self):
         """Confirm correct error raised if 'body' is reset to None."""
-        import pent
-
         prs = pent.Parser(body="#..i")
 
         prs.body = None
@@ -713,15 +704,13 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_manual_two_lines(self):
         """Run manual check on concatenating two single-line regexes."""
-        import pent
-
         test_str = "This is line one: 12345  \nAnd this is line two: -3e-5"
 
         test_pat_1 = "~ @!.one: #!.+i"
         test_pat_2 = "~ @!.two: #!.-s"
 
-        cp_1 = self.prs.convert_line(test_pat_1)[0]
-        cp_2 = self.prs.convert_line(test_pat_2, group_id=2)[0]
+        cp_1 = _convert_line(test_pat_1)[0]
+        cp_2 = _convert_line(test_pat_2, group_id=2)[0]
 
         m = re.search(cp_1 + r"\n" + cp_2, test_str)
 
@@ -733,8 +722,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_quick_one_or_more_number(self):
         """Run quick check on capture of one-or-more number token."""
-        import pent
-
         numbers = "2 5 -54 3.8 -1.e-12"
 
         test_str = "This has numbers {} with end space.".format(numbers)
@@ -743,8 +730,8 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
         test_pat = "~ #!+.g ~"
         test_pat_period = "~ #x!+.g @.."
 
-        re_pat = self.prs.convert_line(test_pat)[0]
-        re_pat_period = self.prs.convert_line(test_pat_period)[0]
+        re_pat = _convert_line(test_pat)[0]
+        re_pat_period = _convert_line(test_pat_period)[0]
 
         with self.subTest("end_space"):
             m_pat = re.search(re_pat, test_str)
@@ -762,8 +749,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_multiline_body_parser(self):
         """Confirm parsing w/multi-line body works ok."""
-        import pent
-
         result = [[["1", "2", "4"]]]
 
         text = "\n1\n\n2\n\n\n4"
@@ -775,10 +760,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_optional_space_after_literal(self):
         """Confirm the optional-space matching works."""
-        from textwrap import dedent
-
-        import pent
-
         text = dedent(
             """\
             1 2 3 4 5
@@ -797,10 +778,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_optional_space_after_number(self):
         """Confirm optional-space works for after numbers."""
-        from textwrap import dedent
-
-        import pent
-
         text = dedent(
             """
             1 2 3 4 5
@@ -821,12 +798,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_simple_multiblock(self):
         """Confirm simple multiblock parser works correctly."""
-        from textwrap import dedent
-
-        import pent
-
-        from .testdata import mblock_result
-
         data = dedent(
             """
                test
@@ -852,12 +823,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_repeated_multiblock(self):
         """Confirm repeated multiblock parser works correctly."""
-        from textwrap import dedent
-
-        import pent
-
-        from .testdata import mblock_repeated_result
-
         data = dedent(
             """
             $top
@@ -885,8 +850,6 @@ class TestPentParserPatterns(ut.TestCase, SuperPent):
 
     def test_parsers_in_head_and_tail(self):
         """Confirm proper behavior of Parsers for head and tail."""
-        import pent
-
         data = dedent(
             """\
             HEAD 1 2
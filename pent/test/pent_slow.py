@@ -31,87 +31,131 @@ import itertools as itt
 import re
 import unittest as ut
 
-from .pent_base import SuperPent
+import pent
 
+from .pent_base import _maybe_subtest, SuperPent
+from .testdata import number_patterns as nps
 
-class TestPentParserPatternsSlow(ut.TestCase, SuperPent):
-    """SLOW tests confirming pattern matching of Parser regexes."""
 
-    def test_three_token_sequence(self):
-        """Ensure combinatorial token sequence parses correctly."""
-        import pent
+_STR_OR_NUM = (pent.Content.String, pent.Content.Number)
 
-        from .testdata import number_patterns as nps
+# Token pattern templates, and the values they match, for each content type
+_SRC_MAP = {
+    pent.Content.String: {"foo": "@{0}{1}{2}foo"},
+    pent.Content.Number: nps,
+}
+_SRC_KEYS = {c: tuple(src) for c, src in _SRC_MAP.items()}
 
-        pat_template = "~ {0} {1} {2} ~"
-        str_template = "String! {0}{1}{2}{3}{4} More String!"
-        str_pat = {"foo": "@{0}{1}{2}foo"}
+# No reason to have no-space strings against one another;
+# no-space numbers adjacent to one another make
+# no syntactic sense.
+_COMBOS = tuple(
+    (c1, s1, c2, s2, c3)
+    for c1, s1, c2, s2, c3 in itt.product(
+        _STR_OR_NUM, (True, False), _STR_OR_NUM, (True, False), _STR_OR_NUM
+    )
+    if not ((c1 is c2 and not s1) or (c2 is c3 and not s2))
+)
 
-        testname_template = "{0}_{1}_{2}_{3}_{4}"
 
-        str_or_num = (pent.Content.String, pent.Content.Number)
-        t_f = (True, False)
+class TestPentParserPatternsSlow(ut.TestCase, SuperPent):
+    """SLOW tests confirming pattern matching of Parser regexes.
 
-        for c1, s1, c2, s2, c3 in itt.product(
-            str_or_num, t_f, str_or_num, t_f, str_or_num
-        ):
-            if (c1 is c2 and not s1) or (c2 is c3 and not s2):
-                # No reason to have no-space strings against one another;
-                # no-space numbers adjacent to one another make
-                # no syntactic sense.
-                continue
-
-            vals1 = str_pat if c1 == pent.Content.String else nps.keys()
-            vals2 = str_pat if c2 == pent.Content.String else nps.keys()
-            vals3 = str_pat if c3 == pent.Content.String else nps.keys()
-
-            for v1, v2, v3 in itt.product(vals1, vals2, vals3):
-                p1 = (str_pat if c1 == pent.Content.String else nps)[
-                    v1
-                ].format(
-                    pent.SpaceAfter.Prohibited if not s1 else "",
-                    pent.Token._s_capture,
-                    pent.Quantity.Single,
-                )
-                p2 = (str_pat if c2 == pent.Content.String else nps)[
-                    v2
-                ].format(
-                    pent.SpaceAfter.Prohibited if not s2 else "",
+    A separate ``test_three_token_sequence_*`` method is generated for
+    each content/spacing combination (see below the class), so that
+    runners that distribute tests across processes can split them up,
+    e.g. ``pytest -n auto pent/test/pent_slow.py`` with pytest-xdist.
+
+    """
+
+    pat_template = "~ {0} {1} {2} ~"
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the token fragments shared by all combinations."""
+        # Token fragments depend only on content, trailing space, and value
+        cls._frags = {}
+        for c, sp in itt.product(_STR_OR_NUM, (True, False)):
+            src = _SRC_MAP[c]
+
+            for v in src:
+                cls._frags[c, sp, v] = src[v].format(
+                    pent.SpaceAfter.Prohibited if not sp else "",
                     pent.Token._s_capture,
                     pent.Quantity.Single,
                 )
-                p3 = (str_pat if c3 == pent.Content.String else nps)[
-                    v3
-                ].format("", pent.Token._s_capture, pent.Quantity.Single)
 
-                test_pat = pat_template.format(p1, p2, p3)
-                test_str = str_template.format(
-                    v1, " " if s1 else "", v2, " " if s2 else "", v3
+    def check_three_token_sequence(self, c1, s1, c2, s2, c3):
+        """Ensure one combinatorial token sequence parses correctly."""
+        frags = self._frags
+
+        for v1, v2, v3 in itt.product(
+            _SRC_KEYS[c1], _SRC_KEYS[c2], _SRC_KEYS[c3]
+        ):
+            p1 = frags[c1, s1, v1]
+            p2 = frags[c2, s2, v2]
+            p3 = frags[c3, True, v3]  # no space-after flag at the end
+
+            sp1 = " " if s1 else ""
+            sp2 = " " if s2 else ""
+
+            test_pat = self.pat_template.format(p1, p2, p3)
+            test_str = "".join(
+                ("String! ", v1, sp1, v2, sp2, v3, " More String!")
+            )
+
+            with _maybe_subtest(
+                self, "_".join, (v1, str(s1), v2, str(s2), v3)
+            ):
+                # Every pattern here is unique, so bypass the memoized
+                # wrapper rather than churn its cache
+                npat = self.prs.convert_line(test_pat)[0]
+
+                m = re.match(npat, test_str)
+
+                self.assertIsNotNone(m, msg=test_pat)
+                self.assertEqual(
+                    m.group(pent.Token.group_prefix + "0"),
+                    v1,
+                    msg=test_pat + " :: " + test_str,
+                )
+                self.assertEqual(
+                    m.group(pent.Token.group_prefix + "1"),
+                    v2,
+                    msg=test_pat + " :: " + test_str,
                 )
+                self.assertEqual(
+                    m.group(pent.Token.group_prefix + "2"),
+                    v3,
+                    msg=test_pat + " :: " + test_str,
+                )
+
+
+def _make_three_token_test(c1, s1, c2, s2, c3):
+    """Create the test method for one content/spacing combination."""
+
+    def test(self):
+        self.check_three_token_sequence(c1, s1, c2, s2, c3)
+
+    test.__doc__ = "Ensure {0} token sequence parses correctly.".format(
+        " ".join((c1.name, str(s1), c2.name, str(s2), c3.name))
+    )
+
+    return test
+
 
-                with self.subTest(
-                    testname_template.format(v1, s1, v2, s2, v3)
-                ):
-                    npat = self.prs.convert_line(test_pat)[0]
-
-                    m = re.search(npat, test_str)
-
-                    self.assertIsNotNone(m, msg=test_pat)
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "0"),
-                        v1,
-                        msg=test_pat + " :: " + test_str,
-                    )
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "1"),
-                        v2,
-                        msg=test_pat + " :: " + test_str,
-                    )
-                    self.assertEqual(
-                        m.group(pent.Token.group_prefix + "2"),
-                        v3,
-                        msg=test_pat + " :: " + test_str,
-                    )
+for (_c1, _s1, _c2, _s2, _c3) in _COMBOS:
+    setattr(
+        TestPentParserPatternsSlow,
+        "test_three_token_sequence_{0}_{1}_{2}_{3}_{4}".format(
+            _c1.name,
+            "sp" if _s1 else "nosp",
+            _c2.name,
+            "sp" if _s2 else "nosp",
+            _c3.name,
+        ),
+        _make_three_token_test(_c1, _s1, _c2, _s2, _c3),
+    )
 
 
 def suite_base_slow():